@@ -40,6 +40,7 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING
 from typing import Collection
 from typing import Dict
+from typing import FrozenSet
 from typing import Set
 
 from analytix.errors import InvalidRequest
@@ -126,22 +127,18 @@ class FeatureType(metaclass=abc.ABCMeta):
 
 
 class SegmentedFeatureType(metaclass=abc.ABCMeta):
-    __slots__ = ("values",)
+    __slots__ = ("values", "_every")
 
     def __init__(self, *args: "SetType") -> None:
         self.values = set(args)
+        self._every = frozenset().union(*(set_type.values for set_type in args))
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(values={self.values})"
 
     @property
-    def every(self) -> Set[str]:
-        every = set()
-
-        for set_type in self.values:
-            every |= set_type.values
-
-        return every
+    def every(self) -> FrozenSet[str]:
+        return self._every
 
     @abc.abstractmethod
     def validate(self, inputs: Collection[str]) -> None:
@@ -149,22 +146,18 @@ class SegmentedFeatureType(metaclass=abc.ABCMeta):
 
 
 class MappingFeatureType(metaclass=abc.ABCMeta):
-    __slots__ = ("values",)
+    __slots__ = ("values", "_every")
 
     def __init__(self, *args: "SetType") -> None:
         self.values = set(args)
+        self._every = frozenset().union(*(set_type.values for set_type in args))
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(values={self.values})"
 
     @property
-    def every(self) -> Set[str]:
-        every = set()
-
-        for set_type in self.values:
-            every |= set_type.values
-
-        return every
+    def every(self) -> FrozenSet[str]:
+        return self._every
 
     @abc.abstractmethod
     def validate(self, inputs: Dict[str, str]) -> None:
@@ -51,25 +51,33 @@ __all__ = (
 import hashlib
 import json
 import logging
+import operator
 import os
 import re
 import sys
 from dataclasses import dataclass
 from enum import Flag
+from functools import lru_cache
 from http.server import BaseHTTPRequestHandler
 from http.server import HTTPServer
 from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
 from typing import Dict
 from typing import List
 from typing import Literal
 from typing import Optional
+from typing import Tuple
+from typing import Type
 from typing import Union
 from urllib.parse import parse_qsl
 from urllib.parse import urlencode
 
 from analytix.errors import AuthorisationError
-from analytix.types import PathLike
-from analytix.types import UriParams
+
+if TYPE_CHECKING:
+    from analytix.types import PathLike
+    from analytix.types import UriParams
 
 REDIRECT_URI_PATTERN = re.compile("[^//]*//([^:]*):?([0-9]*)")
 SCOPE_URLS = [
@@ -80,7 +88,25 @@ SCOPE_URLS = [
     "https://www.googleapis.com/auth/userinfo.email",
 ]
 
+TOKEN_FIELDS = (
+    "access_token",
+    "expires_in",
+    "scope",
+    "token_type",
+    "refresh_token",
+    "id_token",
+)
+
 _log = logging.getLogger(__name__)
+_token_field_set = frozenset(TOKEN_FIELDS)
+_token_getter = operator.attrgetter(*TOKEN_FIELDS)
+
+
+@lru_cache(maxsize=None)
+def _format_scopes(value: int) -> str:
+    # There are only a few dozen possible combinations, and each is
+    # formatted on every authorisation check.
+    return " ".join(url for i, url in enumerate(SCOPE_URLS) if value & (1 << i))
 
 
 class Scopes(Flag):
@@ -115,9 +141,7 @@ class Scopes(Flag):
 
     @property
     def formatted(self) -> str:
-        return " ".join(
-            url for i, url in enumerate(SCOPE_URLS) if self.value & (1 << i)
-        )
+        return _format_scopes(self.value)
 
     def validate(self) -> None:
         if not (self.value & (1 << 0) or self.value & (1 << 1)):
@@ -178,7 +202,7 @@ class Secrets:
     redirect_uris: List[str]
 
     @classmethod
-    def load_from(cls, path: PathLike) -> "Secrets":
+    def load_from(cls, path: "PathLike") -> "Secrets":
         """Load secrets from a JSON file.
 
         ???+ note "Changed in version 5.0"
@@ -265,7 +289,7 @@ class Tokens:
     id_token: Optional[str] = None
 
     @classmethod
-    def load_from(cls, path: PathLike) -> "Tokens":
+    def load_from(cls, path: "PathLike") -> "Tokens":
         """Load tokens from a JSON file.
 
         ???+ note "Changed in version 5.0"
@@ -298,7 +322,7 @@ class Tokens:
         if _log.isEnabledFor(logging.DEBUG):
             _log.debug("Loading tokens from %s", tokens_file.resolve())
 
-        return cls.from_json(tokens_file.read_text())
+        return cls.from_json(tokens_file.read_bytes())
 
     @classmethod
     def from_json(cls, data: Union[str, bytes]) -> "Tokens":
@@ -326,7 +350,7 @@ class Tokens:
         """
         return cls(**json.loads(data))
 
-    def save_to(self, path: PathLike) -> None:
+    def save_to(self, path: "PathLike") -> None:
         """Save your tokens to disk.
 
         ???+ note "Changed in version 5.0"
@@ -351,15 +375,11 @@ class Tokens:
         if _log.isEnabledFor(logging.DEBUG):
             _log.debug("Saving tokens to %s", tokens_file.resolve())
 
-        attrs = {
-            "access_token": self.access_token,
-            "expires_in": self.expires_in,
-            "scope": self.scope,
-            "token_type": self.token_type,
-            "refresh_token": self.refresh_token,
-            **({"id_token": self.id_token} if self.id_token else {}),
-        }
-        tokens_file.write_text(json.dumps(attrs))
+        attrs = dict(zip(TOKEN_FIELDS, _token_getter(self)))
+        if not attrs["id_token"]:
+            del attrs["id_token"]
+
+        tokens_file.write_text(json.dumps(attrs, separators=(",", ":")))
 
     def refresh(self, data: Union[str, bytes]) -> "Tokens":
         """Updates your tokens to match those you refreshed.
@@ -391,10 +411,15 @@ class Tokens:
         Tokens(access_token="abcdefghij", ...)
         """
         attrs = json.loads(data)
-        for key, value in attrs.items():
-            setattr(self, key, value)
+        for key in _token_field_set.intersection(attrs):
+            setattr(self, key, attrs[key])
         return self
 
+    def __reduce__(self) -> Tuple[Type["Tokens"], Tuple[Any, ...]]:
+        # Pickle as constructor arguments rather than through the
+        # dataclass' generated state methods.
+        return (self.__class__, _token_getter(self))
+
 
 def state_token() -> str:
     """Generates a state token.
@@ -412,7 +437,7 @@ def state_token() -> str:
     return hashlib.sha256(os.urandom(1024)).hexdigest()
 
 
-def auth_uri(secrets: Secrets, scopes: Scopes, port: int) -> UriParams:
+def auth_uri(secrets: Secrets, scopes: Scopes, port: int) -> "UriParams":
     """Returns the authentication URI and parameters.
 
     ???+ note "Changed in version 5.0"
@@ -460,7 +485,7 @@ def auth_uri(secrets: Secrets, scopes: Scopes, port: int) -> UriParams:
     return f"{secrets.auth_uri}?{urlencode(params)}", params, {}
 
 
-def token_uri(secrets: Secrets, code: str, redirect_uri: str) -> UriParams:
+def token_uri(secrets: Secrets, code: str, redirect_uri: str) -> "UriParams":
     """Returns the token URI, data, and headers.
 
     Parameters
@@ -493,7 +518,7 @@ def token_uri(secrets: Secrets, code: str, redirect_uri: str) -> UriParams:
     return secrets.token_uri, data, headers
 
 
-def refresh_uri(secrets: Secrets, token: str) -> UriParams:
+def refresh_uri(secrets: Secrets, token: str) -> "UriParams":
     """Returns the refresh URI, data, and headers.
 
     Parameters
@@ -547,22 +572,25 @@ def run_flow(auth_params: Dict[str, str]) -> str:
     if not (match := REDIRECT_URI_PATTERN.match(auth_params["redirect_uri"])):
         raise AuthorisationError("invalid redirect URI")
 
+    landing_page = (Path(__file__).parent / "landing.html").read_bytes()
+
     class RequestHandler(BaseHTTPRequestHandler):
         def log_request(
             self,
             code: Union[int, str] = "-",
             _: Union[int, str] = "-",
         ) -> None:
-            _log.debug(f"Received request ({code})")
+            _log.debug("Received request (%s)", code)
 
         def do_GET(self) -> None:  # noqa: N802
             self.send_response(200)
             self.send_header("Content-Type", "text/html")
+            self.send_header("Content-Length", str(len(landing_page)))
             self.end_headers()
 
             self.server: Server
-            self.server.query_params = dict(parse_qsl(self.path.split("?")[1]))
-            self.wfile.write((Path(__file__).parent / "landing.html").read_bytes())
+            self.server.query_params = dict(parse_qsl(self.path.partition("?")[2]))
+            self.wfile.write(landing_page)
 
     class Server(HTTPServer):
         def __init__(self, address: str, port: int) -> None:
@@ -55,7 +55,7 @@ import datetime as dt
 import json
 import logging
 import os
-import platform
+import time
 import warnings
 import webbrowser
 from abc import ABCMeta
@@ -67,6 +67,7 @@ from typing import Any
 from typing import Collection
 from typing import Dict
 from typing import Generator
+from typing import List
 from typing import Optional
 
 from analytix import auth
@@ -80,18 +81,22 @@ from analytix.errors import IdTokenError
 from analytix.errors import MissingOptionalComponents
 from analytix.mixins import RequestMixin
 from analytix.shard import Shard
-from analytix.types import PathLike
 from analytix.warnings import NotUpdatedWarning
 
 if TYPE_CHECKING:
     from analytix.groups import GroupItemList
     from analytix.groups import GroupList
     from analytix.reports import Report
+    from analytix.types import PathLike
 
 JWKS_URI = "https://www.googleapis.com/oauth2/v3/certs"
 OAUTH_CHECK_URL = "https://www.googleapis.com/oauth2/v3/tokeninfo?access_token="
 UPDATE_CHECK_URL = "https://pypi.org/pypi/analytix/json"
 
+# Tokens held in memory are treated as expired this many seconds early so
+# they aren't handed out moments before Google stops accepting them.
+TOKEN_EXPIRY_LEEWAY = 60
+
 _log = logging.getLogger(__name__)
 
 
@@ -156,7 +161,7 @@ class BaseClient(RequestMixin, metaclass=ABCMeta):
 
     def __init__(
         self,
-        secrets_file: PathLike,
+        secrets_file: "PathLike",
         *,
         scopes: Scopes = Scopes.READONLY,
     ) -> None:
@@ -281,9 +286,8 @@ class BaseClient(RequestMixin, metaclass=ABCMeta):
         >>> client.scopes_are_sufficient(tokens.scope)
         True
         """
-        # The <= here means "is LHS a subset of RHS?".
-        sufficient = set(self._scopes.formatted.split(" ")) <= set(scopes.split(" "))
-        _log.debug(f"Stored scopes are {'' if sufficient else 'in'}sufficient")
+        sufficient = set(self._scopes.formatted.split(" ")).issubset(scopes.split(" "))
+        _log.debug("Stored scopes are %ssufficient", "" if sufficient else "in")
         return sufficient
 
     def decode_id_token(self, token: str) -> Dict[str, Any]:
@@ -505,14 +509,16 @@ class Client(BaseClient):
 
     def __init__(
         self,
-        secrets_file: PathLike,
+        secrets_file: "PathLike",
         *,
         scopes: Scopes = Scopes.READONLY,
-        tokens_file: PathLike = "tokens.json",
+        tokens_file: "PathLike" = "tokens.json",
         ws_port: int = 8080,
         auto_open_browser: Optional[bool] = None,
     ) -> None:
         def in_wsl() -> bool:
+            import platform
+
             return "microsoft-standard" in platform.uname().release
 
         super().__init__(secrets_file, scopes=scopes)
@@ -525,6 +531,9 @@ class Client(BaseClient):
         if self._tokens_file.suffix != ".json":
             raise ValueError("tokens file must be a JSON file")
 
+        self._tokens: Optional[Tokens] = None
+        self._tokens_expire_at = 0.0
+
     def __enter__(self) -> "Client":
         return self
 
@@ -574,11 +583,23 @@ class Client(BaseClient):
         will only trigger when necessary. Token refreshing is handled
         automatically.
 
+        Tokens the client has just obtained or refreshed are kept in
+        memory until shortly before they expire, so later calls return
+        them without reloading or revalidating them.
+
         Examples
         --------
         >>> client.authorise()
         Tokens(access_token="1234567890", ...)
         """
+        if (
+            not (force or force_refresh)
+            and self._tokens
+            and time.monotonic() < self._tokens_expire_at
+        ):
+            _log.debug("Using tokens held in memory")
+            return self._tokens
+
         if not force and self._tokens_file.is_file():
             tokens = Tokens.load_from(self._tokens_file)
             if self.scopes_are_sufficient(tokens.scope) and (
@@ -618,6 +639,7 @@ class Client(BaseClient):
             tokens = Tokens.from_json(resp.data)
 
         tokens.save_to(self._tokens_file)
+        self._hold_tokens(tokens)
         _log.info("Authorisation complete!")
         return tokens
 
@@ -660,9 +682,19 @@ class Client(BaseClient):
 
         if refreshed := super().refresh_access_token(tokens):
             refreshed.save_to(self._tokens_file)
+            self._hold_tokens(refreshed)
 
         return refreshed
 
+    def _hold_tokens(self, tokens: Tokens) -> None:
+        # Newly issued access tokens are known to be valid for
+        # `expires_in` seconds, so there's no need to reload and
+        # revalidate them on every request until then.
+        self._tokens = tokens
+        self._tokens_expire_at = (
+            time.monotonic() + tokens.expires_in - TOKEN_EXPIRY_LEEWAY
+        )
+
     def fetch_report(
         self,
         *,
@@ -798,6 +830,60 @@ class Client(BaseClient):
                 include_historical_data=include_historical_data,
             )
 
+    def fetch_reports(
+        self,
+        requests: Collection[Dict[str, Any]],
+        **kwargs: Any,
+    ) -> List["Report"]:
+        """Authorise the client and fetch several analytics reports
+        concurrently.
+
+        Parameters
+        ----------
+        requests
+            The reports to fetch. Each item is a dictionary of keyword
+            arguments that `fetch_report` accepts.
+
+        Other Parameters
+        ----------------
+        **kwargs
+            Additional keyword arguments to be passed to the `authorise`
+            method.
+
+        Returns
+        -------
+        List[Report]
+            The reports, in the same order as the requests.
+
+        Raises
+        ------
+        InvalidRequest
+            One of your requests was invalid.
+        BadRequest
+            One of your requests was invalid, but it was not caught by
+            analytix's verification systems.
+        Unauthorised
+            Your access token is invalid.
+        Forbidden
+            You tried to access data you're not allowed to access.
+        RuntimeError
+            The client attempted to open a new browser tab, but failed.
+        AuthorisationError
+            Something went wrong during authorisation.
+
+        Examples
+        --------
+        >>> client.fetch_reports(
+        ...     [
+        ...         {"dimensions": ("day",)},
+        ...         {"dimensions": ("country",)},
+        ...     ]
+        ... )
+        """
+        tokens = self.authorise(**kwargs)
+        with self.shard(tokens) as shard:
+            return shard.fetch_reports(requests)
+
     def fetch_groups(
         self,
         *,
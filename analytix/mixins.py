@@ -58,7 +58,12 @@ ERROR_MAPPING = {
     404: NotFound,
 }
 
-http = urllib3.PoolManager()
+# Shards are often used from several threads at once, so keep enough
+# connections per host alive for them to be reused rather than
+# discarded after each request (urllib3 only keeps one by default).
+POOL_MAXSIZE = 10
+
+http = urllib3.PoolManager(maxsize=POOL_MAXSIZE)
 
 
 class RequestMixin:
@@ -98,11 +98,11 @@ class ReportQuery:
 
     @property
     def start_date(self) -> str:
-        return self._start_date.strftime("%Y-%m-%d")
+        return self._start_date.isoformat()
 
     @property
     def end_date(self) -> str:
-        return self._end_date.strftime("%Y-%m-%d")
+        return self._end_date.isoformat()
 
     @property
     def include_historical_data(self) -> str:
@@ -122,7 +122,7 @@ class ReportQuery:
             f"&endDate={self.end_date}"
             f"&currency={self.currency}"
             f"&startIndex={self.start_index}"
-            f"&includeHistoricalData={self.include_historical_data}"
+            f"&includeHistoricalChannelData={self.include_historical_data}"
         )
 
     def validate(self, scopes: Scopes) -> None:
@@ -151,10 +151,10 @@ class ReportQuery:
                 InvalidMonthFormatWarning,
                 stacklevel=4,
             )
-            self._start_date = dt.date(self._start_date.year, self._start_date.month, 1)
-            self._end_date = dt.date(self._end_date.year, self._end_date.month, 1)
+            self._start_date = self._start_date.replace(day=1)
+            self._end_date = self._end_date.replace(day=1)
 
-        _log.debug(f"Getting data between {self.start_date} and {self.end_date}")
+        _log.debug("Getting data between %s and %s", self._start_date, self._end_date)
 
         if self.currency not in data.CURRENCIES:
             raise InvalidRequest(
@@ -177,16 +177,20 @@ class ReportQuery:
         elif not scopes & Scopes.READONLY:
             self.metrics = [m for m in self.metrics if m in data.REVENUE_METRICS]
 
-        _log.debug("Metrics set to: " + ", ".join(self.metrics))
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("Metrics set to: %s", ", ".join(self.metrics))
 
-        if diff := {o.strip("-") for o in self.sort_options} - set(self.metrics):
+        # The features convert their inputs to sets anyway, so do that
+        # once here and share the result.
+        metrics = set(self.metrics)
+        if diff := {o.strip("-") for o in self.sort_options} - metrics:
             raise InvalidRequest.non_matching_sort_options(diff)
 
         self.rtype.validate(
-            self.dimensions,
+            set(self.dimensions),
             self.filters,
-            self.metrics,
-            self.sort_options,
+            metrics,
+            set(self.sort_options),
             self.max_results,
             self.start_index,
         )
@@ -405,7 +409,7 @@ class ReportQuery:
 
     def set_report_type(self) -> None:
         self.rtype = self.determine_report_type()
-        _log.debug(f"Report type determined as {self.rtype.name!r}")
+        _log.debug("Report type determined as %r", self.rtype.name)
 
 
 class GroupQuery:
@@ -41,6 +41,7 @@ __all__ = (
 
 from typing import Collection
 from typing import Dict
+from typing import FrozenSet
 from typing import Set
 
 from analytix import abc
@@ -112,8 +113,6 @@ class SortOptions(abc.FeatureType, _CompareMixin):
 
     def validate(self, inputs: Collection[str]) -> None:
         raw_inputs = {i.strip("-") for i in inputs}
-        if not isinstance(inputs, set):
-            inputs = set(inputs)
 
         if diff := raw_inputs - data.ALL_METRICS:
             raise InvalidRequest.invalid("sort option", diff)
@@ -121,7 +120,7 @@ class SortOptions(abc.FeatureType, _CompareMixin):
         if diff := raw_inputs - self.values:
             raise InvalidRequest.incompatible_sort_options(diff)
 
-        if self.descending_only and {i for i in inputs if not i.startswith("-")}:
+        if self.descending_only and not all(i.startswith("-") for i in inputs):
             raise InvalidRequest(
                 "dimensions and filters are incompatible with ascending sort "
                 "options (hint: prefix with '-')",
@@ -144,24 +143,29 @@ class Dimensions(abc.SegmentedFeatureType, _NestedCompareMixin):
 
 
 class Filters(abc.MappingFeatureType, _NestedCompareMixin):
-    @property
-    def every_key(self) -> Set[str]:
-        return {v[: v.index("=")] if "==" in v else v for v in self.every}
-
-    @property
-    def locked(self) -> Dict[str, str]:
-        locked = {}
+    def __init__(self, *args: abc.SetType) -> None:
+        super().__init__(*args)
+        self._every_key = frozenset(
+            v[: v.index("=")] if "==" in v else v for v in self.every
+        )
+        self._locked: Dict[str, str] = {}
 
         for set_type in self.values:
             for value in filter(lambda v: "==" in v, set_type.values):
                 k, v = value.split("==")
-                locked[k] = v
+                self._locked[k] = v
+
+    @property
+    def every_key(self) -> FrozenSet[str]:
+        return self._every_key
 
-        return locked
+    @property
+    def locked(self) -> Dict[str, str]:
+        return self._locked.copy()
 
     def validate(self, inputs: Dict[str, str]) -> None:
         keys = set(inputs.keys())
-        locked = self.locked
+        locked = self._locked
 
         if diff := keys - data.ALL_FILTERS:
             raise InvalidRequest.invalid("filter", diff)
@@ -175,7 +179,7 @@ class Filters(abc.MappingFeatureType, _NestedCompareMixin):
             if k in locked and v != locked[k]:
                 raise InvalidRequest.incompatible_filter_value(k, v)
 
-        if keys - self.every_key:
+        if keys - self._every_key:
             raise InvalidRequest.incompatible_filters(keys)
 
         for set_type in self.values:
@@ -184,7 +188,7 @@ class Filters(abc.MappingFeatureType, _NestedCompareMixin):
 
 class Required(abc.SetType, _CompareMixin):
     def validate_dimensions(self, inputs: Set[str]) -> None:
-        if self.values & inputs == self.values:
+        if self.values <= inputs:
             return
 
         raise InvalidRequest.invalid_set(
@@ -195,7 +199,7 @@ class Required(abc.SetType, _CompareMixin):
         )
 
     def validate_filters(self, keys: Set[str]) -> None:
-        if self.expd_keys & keys == self.expd_keys:
+        if self.expd_keys <= keys:
             return
 
         raise InvalidRequest.invalid_set(
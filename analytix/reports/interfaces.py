@@ -37,6 +37,7 @@ Currently, there is only one of these interfaces.
 
 __all__ = ("Report",)
 
+import csv
 import json
 import logging
 from typing import TYPE_CHECKING
@@ -49,6 +50,7 @@ from analytix import utils
 from analytix.errors import DataFrameConversionError
 from analytix.errors import MissingOptionalComponents
 from analytix.reports.resources import ColumnType
+from analytix.reports.resources import DataType
 from analytix.reports.resources import ResultTable
 from analytix.utils import process_path
 
@@ -62,6 +64,23 @@ if TYPE_CHECKING:
 
 _log = logging.getLogger(__name__)
 
+_NUMPY_DTYPES: Dict[DataType, str] = {
+    DataType.STRING: "O",
+    DataType.INTEGER: "int64",
+    DataType.FLOAT: "float64",
+}
+
+
+def _numpy_dtype(data_type: DataType, values: Tuple[Any, ...]) -> str:
+    dtype = _NUMPY_DTYPES[data_type]
+
+    # NumPy integer arrays can't hold nulls, so fall back to floats (and
+    # NaNs) like pandas would when inferring the type itself.
+    if dtype == "int64" and None in values:
+        return "float64"
+
+    return dtype
+
 
 class Report:
     """An analytics report.
@@ -92,6 +111,7 @@ class Report:
         self.resource = ResultTable.from_json(data)
         self.type = type
         self._shape = (len(data["rows"]), len(self.resource.column_headers))
+        self._arrow_tables: Dict[bool, pa.Table] = {}
 
     @property
     def shape(self) -> Tuple[int, int]:
@@ -199,7 +219,7 @@ class Report:
         overwrite
             Whether to overwrite an existing file.
         **kwargs
-            Additional arguments to pass to `json.dump`. This includes
+            Additional arguments to pass to `json.dumps`. This includes
             `indent`.
 
         Returns
@@ -219,9 +239,10 @@ class Report:
         data = self.resource.data
 
         with open(path, "w") as f:
-            json.dump(data, f, **kwargs)
+            f.write(json.dumps(data, **kwargs))
 
-        _log.info(f"Saved report as JSON to {path.resolve()}")
+        if _log.isEnabledFor(logging.INFO):
+            _log.info("Saved report as JSON to %s", path.resolve())
 
     def to_csv(
         self,
@@ -265,13 +286,17 @@ class Report:
         extension = ".tsv" if delimiter == "\t" else ".csv"
         path = process_path(path, extension, overwrite=overwrite)
 
-        with open(path, "w") as f:
-            f.write(f"{delimiter.join(self.columns)}\n")
-            for row in self.resource.rows:
-                line = delimiter.join(f"{v}" for v in row)
-                f.write(f"{line}\n")
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f, delimiter=delimiter, lineterminator="\n")
+            writer.writerow(self.columns)
+            writer.writerows(self.resource.rows)
 
-        _log.info(f"Saved report as {extension[1:].upper()} to {path.resolve()}")
+        if _log.isEnabledFor(logging.INFO):
+            _log.info(
+                "Saved report as %s to %s",
+                extension[1:].upper(),
+                path.resolve(),
+            )
 
     def to_excel(
         self,
@@ -327,7 +352,8 @@ class Report:
             ws.append(row)
 
         wb.save(str(path))
-        _log.info(f"Saved report as spreadsheet to {path.resolve()}")
+        if _log.isEnabledFor(logging.INFO):
+            _log.info("Saved report as spreadsheet to %s", path.resolve())
 
     def to_pandas(self, *, skip_date_conversion: bool = False) -> "pd.DataFrame":
         """Return this report as a pandas DataFrame.
@@ -376,15 +402,29 @@ class Report:
                 "cannot convert to DataFrame as the returned data has no rows",
             )
 
+        import numpy as np
         import pandas as pd
 
-        df = pd.DataFrame(self.resource.rows, columns=self.columns)
+        # Build each column with the type the API reports for it so
+        # pandas doesn't have to infer them.
+        df = pd.DataFrame(
+            {
+                header.name: np.asarray(
+                    values,
+                    dtype=_numpy_dtype(header.data_type, values),
+                )
+                for header, values in zip(
+                    self.resource.column_headers,
+                    zip(*self.resource.rows),
+                )
+            },
+        )
 
         if not skip_date_conversion and len(s := {"day", "month"} & set(df.columns)):
             col = next(iter(s))
             fmt = {"day": "%Y-%m-%d", "month": "%Y-%m"}[col]
             df[col] = pd.to_datetime(df[col], format=fmt)
-            _log.debug(f"Converted {col!r} column to datetime format")
+            _log.debug("Converted %r column to datetime format", col)
 
         return df
 
@@ -440,6 +480,11 @@ class Report:
                 "cannot convert to Arrow table as the returned data has no rows",
             )
 
+        # Arrow tables are immutable, so the table can be shared between
+        # calls (and between to_feather and to_parquet).
+        if (table := self._arrow_tables.get(skip_date_conversion)) is not None:
+            return table
+
         import pyarrow as pa
         import pyarrow.compute as pc
 
@@ -452,8 +497,9 @@ class Report:
             fmt = {"day": "%Y-%m-%d", "month": "%Y-%m"}[col]
             dt_series = pc.strptime(table.column(col), format=fmt, unit="ns")
             table = table.set_column(0, "day", dt_series)
-            _log.debug(f"Converted {col!r} column to datetime format")
+            _log.debug("Converted %r column to datetime format", col)
 
+        self._arrow_tables[skip_date_conversion] = table
         return table
 
     def to_polars(self, *, skip_date_conversion: bool = False) -> "pl.DataFrame":
@@ -514,13 +560,17 @@ class Report:
 
         import polars as pl
 
-        df = pl.DataFrame(self.resource.rows, schema=self.columns)
+        # Polars stores data by column, so hand it columns rather than
+        # making it transpose the rows itself.
+        df = pl.DataFrame(
+            dict(zip(self.columns, map(list, zip(*self.resource.rows)))),
+        )
 
         if not skip_date_conversion and len(s := {"day", "month"} & set(df.columns)):
             col = next(iter(s))
             fmt = {"day": "%Y-%m-%d", "month": "%Y-%m"}[col]
             df = df.with_columns(pl.col(col).str.strptime(pl.Date, fmt))
-            _log.debug(f"Converted {col!r} column to date format")
+            _log.debug("Converted %r column to date format", col)
 
         return df
 
@@ -582,7 +632,8 @@ class Report:
             **kwargs,
         )
 
-        _log.info(f"Saved report as Apache Feather file to {path.resolve()}")
+        if _log.isEnabledFor(logging.INFO):
+            _log.info("Saved report as Apache Feather file to %s", path.resolve())
 
     def to_parquet(
         self,
@@ -643,4 +694,5 @@ class Report:
             **kwargs,
         )
 
-        _log.info(f"Saved report as Apache Parquet file to {path.resolve()}")
+        if _log.isEnabledFor(logging.INFO):
+            _log.info("Saved report as Apache Parquet file to %s", path.resolve())
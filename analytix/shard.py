@@ -38,13 +38,22 @@ __all__ = ("Shard",)
 import datetime as dt
 import json
 import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
+from typing import Any
 from typing import Collection
 from typing import Dict
+from typing import List
 from typing import Optional
+from typing import Tuple
 
 from analytix.groups import GroupItemList
 from analytix.groups import GroupList
+from analytix.mixins import POOL_MAXSIZE
 from analytix.mixins import RequestMixin
 from analytix.queries import GroupItemQuery
 from analytix.queries import GroupQuery
@@ -58,6 +67,11 @@ if TYPE_CHECKING:
 
 _log = logging.getLogger(__name__)
 
+# Identical report requests made through the same shard within this many
+# seconds of each other are served from its cache rather than the API.
+REPORT_CACHE_TTL = 300
+REPORT_CACHE_SIZE = 64
+
 
 class Shard(RequestMixin):
     """A "mini-client" used to handle requests to the YouTube Analytics
@@ -85,11 +99,82 @@ class Shard(RequestMixin):
     lifetime.
     """
 
-    __slots__ = ("_scopes", "_tokens")
+    __slots__ = (
+        "_scopes",
+        "_tokens",
+        "_inflight",
+        "_inflight_lock",
+        "_report_cache",
+    )
 
     def __init__(self, scopes: "Scopes", tokens: "Tokens") -> None:
         self._scopes = scopes
         self._tokens = tokens
+        self._inflight: Dict[str, Future[bytes]] = {}
+        self._inflight_lock = threading.Lock()
+        self._report_cache: OrderedDict[str, Tuple[float, bytes]] = OrderedDict()
+
+    def _fetch_bytes(self, url: str) -> bytes:
+        # Identical requests made concurrently from multiple threads
+        # share a single HTTP request; the first caller performs it and
+        # everyone else waits on its result.
+        with self._inflight_lock:
+            future = self._inflight.get(url)
+            owner = future is None
+            if future is None:
+                future = self._inflight[url] = Future()
+
+        if not owner:
+            _log.debug("Waiting on identical in-flight request")
+            return future.result()
+
+        try:
+            with self._request(url, token=self._tokens.access_token) as resp:
+                body: bytes = resp.data
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(body)
+            return body
+        finally:
+            with self._inflight_lock:
+                del self._inflight[url]
+
+    def _fetch_json(self, url: str) -> Dict[str, Any]:
+        # Shared and cached responses are kept as bytes and decoded per
+        # caller, so no two callers ever hold the same objects.
+        data: Dict[str, Any] = json.loads(self._fetch_bytes(url))
+        return data
+
+    def _fetch_report_json(self, url: str) -> Dict[str, Any]:
+        now = time.monotonic()
+        body: Optional[bytes] = None
+
+        with self._inflight_lock:
+            if (cached := self._report_cache.get(url)) is not None:
+                fetched_at, cached_body = cached
+                if now - fetched_at < REPORT_CACHE_TTL:
+                    self._report_cache.move_to_end(url)
+                    body = cached_body
+                else:
+                    del self._report_cache[url]
+
+        if body is not None:
+            _log.debug("Using cached report data")
+        else:
+            body = self._fetch_bytes(url)
+
+            with self._inflight_lock:
+                self._report_cache[url] = (now, body)
+                self._report_cache.move_to_end(url)
+                if len(self._report_cache) > REPORT_CACHE_SIZE:
+                    self._report_cache.popitem(last=False)
+
+        # Decoding happens outside the lock so a large report doesn't
+        # hold up other threads.
+        data: Dict[str, Any] = json.loads(body)
+        return data
 
     def fetch_report(
         self,
@@ -176,6 +261,11 @@ class Shard(RequestMixin):
         * The "isCurated" filter will stop working on 30 Jun 2024. See
           the [guide on new playlist reports](../guides/
           new-playlist-reports.md) for information on how to migrate.
+        * Identical reports fetched through the same shard within five
+          minutes of each other reuse the first response rather than
+          making another request. The cache lives and dies with the
+          shard, so it never applies across `Client.fetch_report`
+          calls, each of which uses a new shard.
 
         See Also
         --------
@@ -216,15 +306,77 @@ class Shard(RequestMixin):
             include_historical_data,
         )
         query.validate(self._scopes)
+        return self._create_report(query, self._fetch_report_json(query.url))
 
-        with self._request(query.url, token=self._tokens.access_token) as resp:
-            data = json.loads(resp.data)
-
+    def _create_report(self, query: ReportQuery, data: Dict[str, Any]) -> Report:
         assert query.rtype
         report = Report(data, query.rtype)
         _log.info("Created '%s' report of shape %s", query.rtype, report.shape)
         return report
 
+    def fetch_reports(self, requests: Collection[Dict[str, Any]]) -> List[Report]:
+        """Fetch several analytics reports concurrently.
+
+        All requests are validated before any are made. The requests
+        themselves are then made on their own threads, sharing the
+        connection pool used by `fetch_report`.
+
+        Parameters
+        ----------
+        requests
+            The reports to fetch. Each item is a dictionary of keyword
+            arguments that `fetch_report` accepts.
+
+        Returns
+        -------
+        List[Report]
+            The reports, in the same order as the requests.
+
+        Raises
+        ------
+        InvalidRequest
+            One of your requests was invalid.
+        BadRequest
+            One of your requests was invalid, but it was not caught by
+            analytix's verification systems.
+        Unauthorised
+            Your access token is invalid.
+        Forbidden
+            You tried to access data you're not allowed to access.
+
+        Examples
+        --------
+        >>> shard.fetch_reports(
+        ...     [
+        ...         {"dimensions": ("day",)},
+        ...         {"dimensions": ("country",)},
+        ...     ]
+        ... )
+        """
+        if not requests:
+            return []
+
+        # Every request is validated on this thread before any are sent,
+        # so warnings point at the caller and an invalid request doesn't
+        # waste quota on the others.
+        queries = []
+        for kwargs in requests:
+            query = ReportQuery(**kwargs)
+            query.validate(self._scopes)
+            queries.append(query)
+
+        workers = min(len(queries), POOL_MAXSIZE)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(self._fetch_report_json, q.url) for q in queries]
+            try:
+                data = [future.result() for future in futures]
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+        return [self._create_report(q, d) for q, d in zip(queries, data)]
+
     def fetch_groups(
         self,
         *,
@@ -262,8 +414,7 @@ class Shard(RequestMixin):
             to access monetary data.
         """
         query = GroupQuery(ids, next_page_token)
-        with self._request(query.url, token=self._tokens.access_token) as resp:
-            return GroupList.from_json(self, json.loads(resp.data))
+        return GroupList.from_json(self, self._fetch_json(query.url))
 
     def fetch_group_items(self, group_id: str) -> GroupItemList:
         """Fetch a list of all items within a group.
@@ -291,5 +442,4 @@ class Shard(RequestMixin):
             to access monetary data.
         """
         query = GroupItemQuery(group_id)
-        with self._request(query.url, token=self._tokens.access_token) as resp:
-            return GroupItemList.from_json(json.loads(resp.data))
+        return GroupItemList.from_json(self._fetch_json(query.url))
@@ -28,20 +28,40 @@
 
 __all__ = ("can_use", "process_path")
 
+import re
 from importlib import metadata
 from pathlib import Path
 from typing import TYPE_CHECKING
+from typing import Set
 
 if TYPE_CHECKING:
     from analytix.types import PathLike
 
+_NAME_SEPARATOR_PATTERN = re.compile(r"[-_.]+")
+
+_found_packages: Set[str] = set()
+
+
+def _normalise(name: str) -> str:
+    # Distribution names are compared as described in PEP 503.
+    return _NAME_SEPARATOR_PATTERN.sub("-", name).lower()
+
 
 def can_use(*packages: str) -> bool:
-    try:
-        for package in packages:
+    for package in packages:
+        name = _normalise(package)
+        if name in _found_packages:
+            continue
+
+        # Only packages that were found are remembered, so ones installed
+        # while the process is running are still picked up.
+        try:
             metadata.distribution(package)
-    except metadata.PackageNotFoundError:
-        return False
+        except metadata.PackageNotFoundError:
+            return False
+
+        _found_packages.add(name)
+
     return True
 
 
@@ -49,7 +69,7 @@ def process_path(path: "PathLike", extension: str, *, overwrite: bool) -> Path:
     if not isinstance(path, Path):
         path = Path(path)
 
-    if path.suffix != extension:
+    if not path.name.endswith(extension):
         path = Path(path.name + extension)
 
     if not overwrite and path.is_file():
@@ -32,10 +32,11 @@ __all__ = ("display_splash", "enable_logging")
 
 import logging
 import os
-import platform
 import sys
 import warnings
+from functools import lru_cache
 from importlib.util import find_spec
+from typing import Dict
 from typing import Optional
 from typing import TextIO
 from typing import Type
@@ -67,7 +68,25 @@ BANNER = r"""
     x="\33[0m",
 )
 
+SPLASH = (
+    BANNER + "\n"
+    "\33[3m{description}\33[0m\n\n"
+    "You're using version \33[1m\33[38;5;1m{version}\33[0m.\n\n"
+    "\33[1m\33[38;5;4mInformation:\33[0m\n"
+    " • Python version: {python_version} ({python_implementation})\n"
+    " • Operating system: {system} ({release})\n"
+    " • Installed in: {install_location}\n\n"
+    "\33[1m\33[38;5;2mUseful links:\33[0m\n"
+    " • Documentation: \33[4m{docs}\33[0m\n"
+    " • Source: \33[4m{url}\33[0m\n"
+    " • Changelog: \33[4m{changelog}\33[0m\n\n"
+    "\33[1m\33[38;5;219mThanks for using analytix!\33[0m"
+)
+
+_module_paths: Dict[str, str] = {}
+
 
+@lru_cache(maxsize=1)
 def _install_location() -> str:
     spec = find_spec("analytix")
 
@@ -77,30 +96,68 @@ def _install_location() -> str:
     return "unknown"
 
 
-def display_splash() -> None:
-    r = "\33[38;5;1m"
-    g = "\33[38;5;2m"
-    b = "\33[38;5;4m"
-    l = "\33[38;5;219m"  # noqa: E741
-
-    # sourcery skip: use-fstring-for-concatenation
-    print(  # noqa: T201
-        BANNER + "\n"
-        f"\33[3m{analytix.__description__}\33[0m\n\n"
-        f"You're using version \33[1m{r}{analytix.__version__}\33[0m.\n\n"
-        f"\33[1m{b}Information:\33[0m\n"
-        f" • Python version: {platform.python_version()} "
-        f"({platform.python_implementation()})\n"
-        f" • Operating system: {platform.system()} ({platform.release()})\n"
-        f" • Installed in: {_install_location()}\n\n"
-        f"\33[1m{g}Useful links:\33[0m\n"
-        f" • Documentation: \33[4m{analytix.__docs__}\33[0m\n"
-        f" • Source: \33[4m{analytix.__url__}\33[0m\n"
-        f" • Changelog: \33[4m{analytix.__changelog__}\33[0m\n\n"
-        f"\33[1m{l}Thanks for using analytix!\33[0m",
+@lru_cache(maxsize=1)
+def _splash() -> str:
+    import platform
+
+    return SPLASH.format(
+        description=analytix.__description__,
+        version=analytix.__version__,
+        python_version=platform.python_version(),
+        python_implementation=platform.python_implementation(),
+        system=platform.system(),
+        release=platform.release(),
+        install_location=_install_location(),
+        docs=analytix.__docs__,
+        url=analytix.__url__,
+        changelog=analytix.__changelog__,
     )
 
 
+def display_splash() -> None:
+    print(_splash())  # noqa: T201
+
+
+def _module_name_for(filename: str) -> str:
+    path = os.path.realpath(filename)
+
+    # The path map is only rebuilt when it misses or points at a module
+    # that has since been removed.
+    if (cached := _module_paths.get(path)) is None or cached not in sys.modules:
+        _module_paths.clear()
+        for name, module in sys.modules.copy().items():
+            if module_path := getattr(module, "__file__", None):
+                _module_paths.setdefault(os.path.realpath(module_path), name)
+        cached = _module_paths.get(path)
+
+    if cached:
+        return cached
+
+    return os.path.splitext(os.path.split(filename)[1])[0]
+
+
+_LOG_FORMAT = "{asctime}.{msecs:03.0f} [ {levelname:<7} ] {name}: {message}"
+_LOG_FORMATS = {
+    logging.DEBUG: f"\33[38;5;244m{_LOG_FORMAT}\33[0m",
+    logging.INFO: f"\33[38;5;248m{_LOG_FORMAT}\33[0m",
+    logging.WARNING: f"\33[1m\33[38;5;178m{_LOG_FORMAT}\33[0m",
+    logging.ERROR: f"\33[1m\33[38;5;196m{_LOG_FORMAT}\33[0m",
+    logging.CRITICAL: f"\33[1m\33[48;5;196m{_LOG_FORMAT}\33[0m",
+}
+
+
+class _LevelFormatter(logging.Formatter):
+    def __init__(self) -> None:
+        super().__init__()
+        self._formatters = {
+            level: logging.Formatter(fmt, "%F %X", style="{")
+            for level, fmt in _LOG_FORMATS.items()
+        }
+
+    def format(self, record: logging.LogRecord) -> str:
+        return self._formatters[record.levelno].format(record)
+
+
 def enable_logging(level: int = logging.INFO) -> "logging.StreamHandler[TextIO]":
     """Enable analytix's preconfigured logger.
 
@@ -123,23 +180,8 @@ def enable_logging(level: int = logging.INFO) -> "logging.StreamHandler[TextIO]"
     >>> analytix.enable_logging(logging.DEBUG)
     """
 
-    fmt = "{asctime}.{msecs:03.0f} [ {levelname:<7} ] {name}: {message}"
-    formats = {
-        logging.DEBUG: f"\33[38;5;244m{fmt}\33[0m",
-        logging.INFO: f"\33[38;5;248m{fmt}\33[0m",
-        logging.WARNING: f"\33[1m\33[38;5;178m{fmt}\33[0m",
-        logging.ERROR: f"\33[1m\33[38;5;196m{fmt}\33[0m",
-        logging.CRITICAL: f"\33[1m\33[48;5;196m{fmt}\33[0m",
-    }
-
-    class CustomFormatter(logging.Formatter):
-        def format(self, record: logging.LogRecord) -> str:
-            log_fmt = formats[record.levelno]
-            formatter = logging.Formatter(log_fmt, "%F %X", style="{")
-            return formatter.format(record)
-
     handler = logging.StreamHandler()
-    handler.setFormatter(CustomFormatter())
+    handler.setFormatter(_LevelFormatter())
     logging.basicConfig(level=level, handlers=[handler])
     logging._srcfile = None  # noqa: SLF001
     logging.logThreads = False
@@ -154,13 +196,7 @@ def enable_logging(level: int = logging.INFO) -> "logging.StreamHandler[TextIO]"
         file: Optional["TextIO"] = None,
         line: Optional[str] = None,
     ) -> None:
-        for _module_name, module in sys.modules.items():
-            module_path = getattr(module, "__file__", None)
-            if module_path and os.path.samefile(module_path, filename):
-                break
-        else:
-            _module_name = os.path.splitext(os.path.split(filename)[1])[0]
-        log = logging.getLogger(_module_name)
+        log = logging.getLogger(_module_name_for(filename))
         log.warning(message)
 
     warnings.simplefilter("always", DeprecationWarning)
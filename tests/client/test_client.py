@@ -31,6 +31,7 @@ import json
 import logging
 import os
 import re
+import time
 import warnings
 from pathlib import Path
 from unittest import mock
@@ -43,7 +44,7 @@ from analytix.client import BaseClient, Client
 from analytix.errors import AuthorisationError
 from analytix.reports import Report
 from analytix.shard import Shard
-from analytix.warnings import NotUpdatedWarning
+from analytix.warnings import InvalidMonthFormatWarning, NotUpdatedWarning
 from tests import MockFile, MockResponse
 
 
@@ -113,6 +114,26 @@ def test_client_check_for_updates_on_init(caplog, secrets_data):
                         assert len(warns) == 0
 
 
+def test_client_check_for_updates_on_init_warns_in_caller(secrets_data):
+    with mock.patch.dict(os.environ, {"PYTEST_CURRENT_TEST": ""}):
+        with mock.patch.object(Path, "read_text", return_value=secrets_data):
+            with warnings.catch_warnings(record=True) as warns:
+                warnings.simplefilter("always")
+                with mock.patch.object(
+                    Client,
+                    "_request",
+                    return_value=MockResponse(
+                        json.dumps({"info": {"version": "4.2.0"}}), 200
+                    ),
+                ):
+                    Client("secrets.json")
+
+                # The warning must already have been issued by the time
+                # the client is returned.
+                assert len(warns) == 1
+                assert issubclass(warns[0].category, NotUpdatedWarning)
+
+
 def test_client_check_for_updates_failed(caplog, secrets_data):
     with mock.patch.object(Path, "read_text", return_value=secrets_data):
         with caplog.at_level(logging.DEBUG):
@@ -377,6 +398,45 @@ def test_client_refresh_access_token_force_valid_tokens(
         assert refreshed.access_token == refreshed_tokens.access_token
 
 
+@mock.patch.object(Tokens, "save_to", return_value=None)
+@mock.patch.object(Client, "token_is_valid", return_value=False)
+def test_client_authorise_uses_refreshed_tokens_in_memory(
+    mock_token_is_valid, mock_save_to, client: Client, tokens, refreshed_tokens, caplog
+):
+    with mock.patch.object(
+        BaseClient, "refresh_access_token", return_value=refreshed_tokens
+    ):
+        client.refresh_access_token(tokens)
+
+    with caplog.at_level(logging.DEBUG):
+        with mock.patch.object(Tokens, "load_from") as mock_load_from:
+            assert client.authorise() is refreshed_tokens
+            mock_load_from.assert_not_called()
+
+        assert "Using tokens held in memory" in caplog.text
+
+
+@mock.patch.object(Tokens, "save_to", return_value=None)
+@mock.patch.object(Client, "token_is_valid", return_value=False)
+def test_client_authorise_ignores_expired_tokens_in_memory(
+    mock_token_is_valid, mock_save_to, client: Client, tokens, refreshed_tokens
+):
+    with mock.patch.object(
+        BaseClient, "refresh_access_token", return_value=refreshed_tokens
+    ):
+        client.refresh_access_token(tokens)
+
+    later = time.monotonic() + refreshed_tokens.expires_in
+    with mock.patch("analytix.client.time.monotonic", return_value=later):
+        with mock.patch.object(Path, "is_file", return_value=True):
+            with mock.patch.object(
+                Tokens, "load_from", side_effect=RuntimeError
+            ) as mock_load_from:
+                with pytest.raises(RuntimeError):
+                    client.authorise()
+                mock_load_from.assert_called_once()
+
+
 def test_client_fetch_report(client: Client, tokens, report: Report):
     with mock.patch.object(Client, "authorise", return_value=tokens):
         with mock.patch.object(Shard, "fetch_report", return_value=report):
@@ -390,6 +450,37 @@ def test_client_fetch_report(client: Client, tokens, report: Report):
             assert report.shape == (7, 2)
 
 
+def test_client_fetch_reports(client: Client, tokens, report: Report):
+    with mock.patch.object(Client, "authorise", return_value=tokens):
+        with mock.patch.object(
+            Shard, "fetch_reports", return_value=[report, report]
+        ) as mock_fetch_reports:
+            requests = [{"dimensions": ("day",)}, {"dimensions": ("month",)}]
+            reports = client.fetch_reports(requests)
+
+            assert reports == [report, report]
+            mock_fetch_reports.assert_called_once_with(requests)
+
+
+def test_client_fetch_reports_warns_at_call_site(client: Client, tokens, response):
+    requests = [
+        {
+            "dimensions": ("month",),
+            "start_date": dt.date(2022, 1, 2),
+            "end_date": dt.date(2022, 6, 2),
+        },
+    ]
+
+    with mock.patch.object(Client, "authorise", return_value=tokens):
+        with mock.patch.object(Shard, "_request", return_value=response):
+            with warnings.catch_warnings(record=True) as warns:
+                warnings.simplefilter("always")
+                client.fetch_reports(requests)
+
+    assert issubclass(warns[0].category, InvalidMonthFormatWarning)
+    assert warns[0].filename == __file__
+
+
 def test_client_fetch_groups(client: Client, tokens, group_list):
     with mock.patch.object(Client, "authorise", return_value=tokens):
         with mock.patch.object(Shard, "fetch_groups", return_value=group_list):
@@ -105,7 +105,7 @@ def test_url_property(query):
         "&endDate=2021-12-31"
         "&currency=USD"
         "&startIndex=1"
-        "&includeHistoricalData=false"
+        "&includeHistoricalChannelData=false"
     )
 
 
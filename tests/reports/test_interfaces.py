@@ -96,6 +96,18 @@ def test_report_to_csv(mock_open, report_csv, report: Report, caplog):
     assert "Saved report as CSV" in caplog.text
 
 
+@mock.patch("builtins.open")
+def test_report_to_csv_quotes_delimiters(
+    mock_open, result_table_data, report_type, caplog
+):
+    result_table_data["rows"] = [["2022-06-20", "1,000"]]
+    f = MockFile()
+    mock_open.return_value = f
+
+    Report(result_table_data, report_type).to_csv("report.csv")
+    assert f.write_data == 'day,views\n2022-06-20,"1,000"\n'
+
+
 @mock.patch("builtins.open")
 def test_report_to_tsv(mock_open, report_tsv, report: Report, caplog):
     f = MockFile(report_tsv)
@@ -166,6 +178,21 @@ def test_report_to_pandas_skip_conversions(response_data, report: Report):
         assert list(row)[1:] == json.loads(response_data)["rows"][i][1:]
 
 
+@pytest.mark.skipif(not utils.can_use("pandas"), reason="pandas is not available")
+def test_report_to_pandas_dtypes(report: Report):
+    df = report.to_pandas(skip_date_conversion=True)
+    assert df["day"].dtype == object
+    assert df["views"].dtype == "int64"
+
+
+@pytest.mark.skipif(not utils.can_use("pandas"), reason="pandas is not available")
+def test_report_to_pandas_null_integers(result_table_data, report_type):
+    result_table_data["rows"][0][1] = None
+    df = Report(result_table_data, report_type).to_pandas()
+    assert df["views"].dtype == "float64"
+    assert df["views"].isna().sum() == 1
+
+
 @pytest.mark.skipif(not utils.can_use("pandas"), reason="pandas is not available")
 def test_report_to_pandas_empty_df(empty_report: Report):
     assert empty_report.shape == (0, 2)
@@ -222,6 +249,13 @@ def test_report_to_arrow_skip_conversions(report: Report):
         assert col.to_pylist() == list(columns[i])
 
 
+@pytest.mark.skipif(not utils.can_use("pyarrow"), reason="PyArrow is not available")
+def test_report_to_arrow_is_cached(report: Report):
+    table = report.to_arrow()
+    assert report.to_arrow() is table
+    assert report.to_arrow(skip_date_conversion=True) is not table
+
+
 @pytest.mark.skipif(not utils.can_use("pyarrow"), reason="PyArrow is not available")
 def test_report_to_arrow_empty_df(empty_report: Report):
     assert empty_report.shape == (0, 2)
@@ -28,6 +28,7 @@
 
 import json
 import logging
+import pickle
 import time
 from functools import partial
 from multiprocessing.pool import ThreadPool
@@ -175,7 +176,9 @@ def test_tokens_save_to(tokens: Tokens, tokens_data: str, caplog):
         f = MockFile()
         with mock.patch.object(Path, "open", return_value=f):
             tokens.save_to("tokens.json")
-            assert f.write_data == tokens_data
+            assert f.write_data == json.dumps(
+                json.loads(tokens_data), separators=(",", ":")
+            )
 
         assert "Saving tokens to" in caplog.text
 
@@ -185,6 +188,25 @@ def test_tokens_refresh(tokens: Tokens):
     assert tokens.access_token == "f6g7h8i9j0"
 
 
+def test_tokens_refresh_ignores_unknown_keys(tokens: Tokens):
+    tokens.refresh(
+        json.dumps({"access_token": "f6g7h8i9j0", "refresh_token_expires_in": 1})
+    )
+    assert tokens.access_token == "f6g7h8i9j0"
+    assert not hasattr(tokens, "refresh_token_expires_in")
+
+
+def test_tokens_save_to_with_id_token(full_tokens: Tokens, id_token: str):
+    f = MockFile()
+    with mock.patch.object(Path, "open", return_value=f):
+        full_tokens.save_to("tokens.json")
+        assert json.loads(f.write_data)["id_token"] == id_token
+
+
+def test_tokens_pickle(full_tokens: Tokens):
+    assert pickle.loads(pickle.dumps(full_tokens)) == full_tokens
+
+
 def test_state_token():
     with mock.patch("os.urandom", return_value=b"rickroll"):
         assert (
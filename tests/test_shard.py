@@ -28,11 +28,20 @@
 
 import datetime as dt
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from unittest import mock
 
+import pytest
+
 from analytix.auth import Scopes
+from analytix.errors import APIError
+from analytix.errors import InvalidRequest
 from analytix.mixins import RequestMixin
 from analytix.reports import Report
+from analytix.shard import REPORT_CACHE_TTL
 from analytix.shard import Shard
 
 
@@ -55,6 +64,83 @@ def test_shard_fetch_report(shard: Shard, report: Report, response, caplog):
         assert "Created 'Time-based activity' report of shape (7, 2)" in caplog.text
 
 
+def test_shard_fetch_report_caches_identical_requests(shard: Shard, response, caplog):
+    kwargs = {
+        "dimensions": ("day",),
+        "metrics": ("views", "likes", "comments", "grossRevenue"),
+        "start_date": dt.date(2022, 6, 20),
+        "end_date": dt.date(2022, 6, 26),
+    }
+
+    with caplog.at_level(logging.DEBUG):
+        with mock.patch.object(
+            RequestMixin, "_request", return_value=response
+        ) as mock_request:
+            shard.fetch_report(**kwargs)
+            shard.fetch_report(**kwargs)
+            assert mock_request.call_count == 1
+            assert "Using cached report data" in caplog.text
+
+            later = time.monotonic() + REPORT_CACHE_TTL
+            with mock.patch("analytix.shard.time.monotonic", return_value=later):
+                shard.fetch_report(**kwargs)
+            assert mock_request.call_count == 2
+
+
+def test_shard_fetch_report_cached_reports_do_not_share_data(shard: Shard, response):
+    kwargs = {
+        "dimensions": ("day",),
+        "start_date": dt.date(2022, 6, 20),
+        "end_date": dt.date(2022, 6, 26),
+    }
+
+    with mock.patch.object(RequestMixin, "_request", return_value=response):
+        first = shard.fetch_report(**kwargs)
+        first.resource.rows.clear()
+        second = shard.fetch_report(**kwargs)
+
+    assert second.shape == (7, 2)
+
+
+def test_shard_fetch_reports(shard: Shard, report: Report, response):
+    requests = [
+        {"dimensions": ("day",), "start_date": dt.date(2022, 6, 20)},
+        {"dimensions": ("day",), "start_date": dt.date(2022, 6, 21)},
+    ]
+
+    with mock.patch.object(
+        RequestMixin, "_request", return_value=response
+    ) as mock_request:
+        reports = shard.fetch_reports(requests)
+        assert mock_request.call_count == 2
+
+    assert len(reports) == 2
+    assert all(r.columns == report.columns for r in reports)
+
+
+def test_shard_fetch_reports_validates_before_fetching(shard: Shard):
+    requests = [{"dimensions": ("day",)}, {"dimensions": ("rickroll",)}]
+
+    with mock.patch.object(RequestMixin, "_request") as mock_request:
+        with pytest.raises(InvalidRequest):
+            shard.fetch_reports(requests)
+        mock_request.assert_not_called()
+
+
+def test_shard_fetch_reports_propagates_errors(shard: Shard):
+    requests = [{"dimensions": ("day",)}, {"dimensions": ("country",)}]
+
+    with mock.patch.object(
+        Shard, "_fetch_report_json", side_effect=APIError(403, "nope")
+    ):
+        with pytest.raises(APIError):
+            shard.fetch_reports(requests)
+
+
+def test_shard_fetch_reports_empty(shard: Shard):
+    assert shard.fetch_reports([]) == []
+
+
 def test_shard_fetch_groups(shard: Shard, group_list, group_list_response):
     with mock.patch.object(RequestMixin, "_request", return_value=group_list_response):
         assert group_list == shard.fetch_groups()
@@ -67,3 +153,67 @@ def test_shard_fetch_group_items(
         RequestMixin, "_request", return_value=group_item_list_response
     ):
         assert group_item_list == shard.fetch_group_items("a1b2c3d4e5")
+
+
+def _wait_for_log(caplog, text, timeout=5):
+    deadline = time.monotonic() + timeout
+    while text not in caplog.text:
+        assert time.monotonic() < deadline, f"timed out waiting for {text!r}"
+        time.sleep(0.01)
+
+
+def test_shard_coalesces_identical_in_flight_requests(
+    shard: Shard, group_item_list, group_item_list_response, caplog
+):
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    @contextmanager
+    def slow_request(self, url, **kwargs):
+        calls.append(url)
+        started.set()
+        release.wait(5)
+        yield group_item_list_response
+
+    with caplog.at_level(logging.DEBUG):
+        with mock.patch.object(RequestMixin, "_request", slow_request):
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                first = pool.submit(shard.fetch_group_items, "a1b2c3d4e5")
+                started.wait(5)
+                second = pool.submit(shard.fetch_group_items, "a1b2c3d4e5")
+                try:
+                    _wait_for_log(caplog, "Waiting on identical in-flight request")
+                finally:
+                    release.set()
+                assert first.result() == group_item_list
+                assert second.result() == group_item_list
+
+    assert len(calls) == 1
+    assert not shard._inflight
+
+
+def test_shard_coalesced_requests_do_not_share_data(
+    shard: Shard, group_item_list_response, caplog
+):
+    started = threading.Event()
+    release = threading.Event()
+
+    @contextmanager
+    def slow_request(self, url, **kwargs):
+        started.set()
+        release.wait(5)
+        yield group_item_list_response
+
+    with caplog.at_level(logging.DEBUG):
+        with mock.patch.object(RequestMixin, "_request", slow_request):
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                first = pool.submit(shard._fetch_json, "https://rickroll")
+                started.wait(5)
+                second = pool.submit(shard._fetch_json, "https://rickroll")
+                try:
+                    _wait_for_log(caplog, "Waiting on identical in-flight request")
+                finally:
+                    release.set()
+                assert first.result() == second.result()
+                assert first.result() is not second.result()
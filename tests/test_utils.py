@@ -47,6 +47,40 @@ def test_can_use_not_installed():
     assert not utils.can_use("rickroll")
 
 
+def _fake_distribution(name):
+    if name.lower().replace(".", "-") != "some-package":
+        raise utils.metadata.PackageNotFoundError(name)
+    return mock.Mock()
+
+
+def test_can_use_normalises_names():
+    utils._found_packages.clear()
+    with mock.patch.object(
+        utils.metadata, "distribution", side_effect=_fake_distribution
+    ) as mock_distribution:
+        assert utils.can_use("some-package")
+        assert utils.can_use("SOME.PACKAGE")
+        assert utils.can_use("Some_Package")
+        assert not utils.can_use("some-package", "rickroll")
+        assert mock_distribution.call_count == 2
+    utils._found_packages.clear()
+
+
+def test_can_use_picks_up_new_installs():
+    utils._found_packages.clear()
+    with mock.patch.object(
+        utils.metadata,
+        "distribution",
+        side_effect=utils.metadata.PackageNotFoundError,
+    ):
+        assert not utils.can_use("some-package")
+    with mock.patch.object(
+        utils.metadata, "distribution", side_effect=_fake_distribution
+    ):
+        assert utils.can_use("some-package")
+    utils._found_packages.clear()
+
+
 @mock.patch.object(Path, "is_file", return_value=False)
 def test_process_path_string_no_extension(_):
     assert utils.process_path("report", ".json", overwrite=False) == Path("report.json")